@@ -25,6 +25,7 @@ from tools.database_tools import (
     add_exhibition,
     add_url,
     add_prize,
+    add_fees_and_prizes,
     describe_schema,
     get_unprocessed_urls,
     get_exhibition_stats,
@@ -165,7 +166,7 @@ class EnhancedAgentOrchestrator:
         self.agents['database'] = ToolCallingAgent(
             model=self._create_model(self.config.DATABASE_MODEL),
             tools=[
-                add_entry_fee, add_exhibition, add_url, add_prize, describe_schema, 
+                add_entry_fee, add_exhibition, add_url, add_prize, add_fees_and_prizes, describe_schema, 
                 get_unprocessed_urls, get_exhibition_stats, bulk_insert_exhibitions,
                 get_exhibitions_by_criteria, generate_fee_analysis_report,
                 cleanup_duplicate_entries, add_database_indexes
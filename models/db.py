@@ -7,12 +7,27 @@ import functools
 import random
 from contextlib import asynccontextmanager, contextmanager
 from typing import AsyncGenerator, Generator
-from sqlalchemy import create_engine, select, and_, func, text, inspect
+from sqlalchemy import create_engine, insert, select, and_, func, text, inspect
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, Session, selectinload
 from models.models import Base, Url, Exhibition, EntryFee, Prize
 
 
+# Insert statements built once and reused, so each call only binds parameters
+_INSERT_ENTRY_FEE = insert(EntryFee).returning(EntryFee)
+_INSERT_PRIZE = insert(Prize).returning(Prize)
+# Rows come back in parameter order even when the backend batches the executemany
+_INSERT_EXHIBITIONS = insert(Exhibition).returning(Exhibition, sort_by_parameter_order=True)
+
+
+def _check_columns(model: type, kwargs: dict) -> None:
+    """Reject unknown keys the way the model constructor does; a bulk INSERT would drop them silently."""
+    columns = inspect(model).column_attrs.keys()
+    for key in kwargs:
+        if key not in columns:
+            raise TypeError(f"{key!r} is an invalid keyword argument for {model.__name__}")
+
+
 class AsyncDatabaseManager:
     """
     Modern async database manager with proper concurrency handling.
@@ -128,6 +143,12 @@ class AsyncDatabaseManager:
             
             if existing:
                 return existing
+            
+            # Prebuilt INSERT ... RETURNING skips the unit of work for a single-row write
+            if self.engine.dialect.insert_returning:
+                _check_columns(EntryFee, kwargs)
+                result = await session.scalars(_INSERT_ENTRY_FEE, [kwargs])
+                return result.one()
                 
             fee = EntryFee(**kwargs)
             session.add(fee)
@@ -137,6 +158,11 @@ class AsyncDatabaseManager:
     async def add_prize(self, **kwargs) -> Prize:
         """Add prize with validation."""
         async with self.get_transaction() as session:
+            if self.engine.dialect.insert_returning:
+                _check_columns(Prize, kwargs)
+                result = await session.scalars(_INSERT_PRIZE, [kwargs])
+                return result.one()
+            
             prize = Prize(**kwargs)
             session.add(prize)
             await session.flush()
@@ -187,19 +213,23 @@ class AsyncDatabaseManager:
         if not exhibitions_data:
             return []
             
+        # Validate required fields
+        required_fields = ['title', 'date_start', 'date_end', 'venue', 'location', 'url_id']
+        for data in exhibitions_data:
+            for field in required_fields:
+                if field not in data:
+                    raise ValueError(f"Missing required field: {field}")
+            _check_columns(Exhibition, data)
+        
         async with self.get_transaction() as session:
-            exhibitions = []
-            
-            for data in exhibitions_data:
-                # Validate required fields
-                required_fields = ['title', 'date_start', 'date_end', 'venue', 'location', 'url_id']
-                for field in required_fields:
-                    if field not in data:
-                        raise ValueError(f"Missing required field: {field}")
-                
-                exhibition = Exhibition(**data)
-                session.add(exhibition)
-                exhibitions.append(exhibition)
+            # Single executemany INSERT ... RETURNING, skipping per-instance unit-of-work overhead
+            if self.engine.dialect.insert_executemany_returning:
+                result = await session.scalars(_INSERT_EXHIBITIONS, exhibitions_data)
+                return list(result.all())
+            
+            # Fall back to the ORM unit of work on SQLite builds without RETURNING
+            exhibitions = [Exhibition(**data) for data in exhibitions_data]
+            session.add_all(exhibitions)
             
             # Flush to get IDs for all exhibitions
             await session.flush()
@@ -593,31 +623,71 @@ class SyncDatabaseManager:
     def add_entry_fee(self, **kwargs) -> EntryFee:
         """Add entry fee with duplicate checking."""
         with self.get_transaction() as session:
-            # Check for existing entry fee to prevent duplicates
-            stmt = select(EntryFee).where(
-                and_(
-                    EntryFee.exhibition_id == kwargs.get('exhibition_id'),
-                    EntryFee.number_entries == kwargs.get('number_entries')
-                )
-            )
-            result = session.execute(stmt)
-            existing = result.scalar_one_or_none()
-            
-            if existing:
-                return existing
-                
-            fee = EntryFee(**kwargs)
-            session.add(fee)
-            session.flush()
-            return fee
+            return self._insert_entry_fee(session, kwargs)
 
     def add_prize(self, **kwargs) -> Prize:
         """Add prize with validation."""
         with self.get_transaction() as session:
-            prize = Prize(**kwargs)
-            session.add(prize)
-            session.flush()
-            return prize
+            return self._insert_prize(session, kwargs)
+
+    def add_fees_and_prizes(
+        self,
+        exhibition_id: int,
+        entry_fees: list[dict],
+        prizes: list[dict],
+    ) -> tuple[list[EntryFee], list[Prize]]:
+        """
+        Add an exhibition's entry fees and prizes in one transaction.
+        Nothing is committed unless every row is written.
+        """
+        with self.get_transaction() as session:
+            fees = [
+                self._insert_entry_fee(session, {**fee, 'exhibition_id': exhibition_id})
+                for fee in entry_fees
+            ]
+            added_prizes = [
+                self._insert_prize(session, {**prize, 'exhibition_id': exhibition_id})
+                for prize in prizes
+            ]
+            return fees, added_prizes
+
+    def _insert_entry_fee(self, session: Session, kwargs: dict) -> EntryFee:
+        """Write one entry fee in the caller's transaction, reusing an existing tier."""
+        # Check for existing entry fee to prevent duplicates
+        stmt = select(EntryFee).where(
+            and_(
+                EntryFee.exhibition_id == kwargs.get('exhibition_id'),
+                EntryFee.number_entries == kwargs.get('number_entries')
+            )
+        )
+        result = session.execute(stmt)
+        existing = result.scalar_one_or_none()
+        
+        if existing:
+            return existing
+        
+        # Prebuilt INSERT ... RETURNING skips the unit of work for a single-row write
+        if self.engine.dialect.insert_returning:
+            _check_columns(EntryFee, kwargs)
+            result = session.scalars(_INSERT_ENTRY_FEE, [kwargs])
+            return result.one()
+            
+        fee = EntryFee(**kwargs)
+        session.add(fee)
+        session.flush()
+        return fee
+
+    def _insert_prize(self, session: Session, kwargs: dict) -> Prize:
+        """Write one prize in the caller's transaction."""
+        if self.engine.dialect.insert_returning:
+            _check_columns(Prize, kwargs)
+            result = session.scalars(_INSERT_PRIZE, [kwargs])
+            return result.one()
+        
+        prize = Prize(**kwargs)
+        session.add(prize)
+        session.flush()
+        return prize
 
     def get_exhibitions_by_date_range(
         self, 
@@ -663,19 +733,23 @@ class SyncDatabaseManager:
         if not exhibitions_data:
             return []
             
+        # Validate required fields
+        required_fields = ['title', 'date_start', 'date_end', 'venue', 'location', 'url_id']
+        for data in exhibitions_data:
+            for field in required_fields:
+                if field not in data:
+                    raise ValueError(f"Missing required field: {field}")
+            _check_columns(Exhibition, data)
+        
         with self.get_transaction() as session:
-            exhibitions = []
-            
-            for data in exhibitions_data:
-                # Validate required fields
-                required_fields = ['title', 'date_start', 'date_end', 'venue', 'location', 'url_id']
-                for field in required_fields:
-                    if field not in data:
-                        raise ValueError(f"Missing required field: {field}")
-                
-                exhibition = Exhibition(**data)
-                session.add(exhibition)
-                exhibitions.append(exhibition)
+            # Single executemany INSERT ... RETURNING, skipping per-instance unit-of-work overhead
+            if self.engine.dialect.insert_executemany_returning:
+                result = session.scalars(_INSERT_EXHIBITIONS, exhibitions_data)
+                return list(result.all())
+            
+            # Fall back to the ORM unit of work on SQLite builds without RETURNING
+            exhibitions = [Exhibition(**data) for data in exhibitions_data]
+            session.add_all(exhibitions)
             
             # Flush to get IDs for all exhibitions
             session.flush()
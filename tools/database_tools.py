@@ -2,6 +2,7 @@
 Enhanced database tools with both synchronous and async implementations.
 According to SQLAlchemy docs: Use appropriate patterns for each use case.
 """
+import functools
 from decimal import Decimal
 from smolagents import tool
 from sqlalchemy import inspect
@@ -31,6 +32,130 @@ def get_sync_db_manager() -> SyncDatabaseManager:
     return _sync_db_manager
 
 
+def _prepare_exhibition_rows(exhibitions_data: list[dict]) -> list[dict]:
+    """Convert ISO date strings to dates once, so rows can go straight to a bulk INSERT."""
+    from datetime import date
+    
+    rows = []
+    for data in exhibitions_data:
+        row = dict(data)
+        try:
+            for field in ('date_start', 'date_end'):
+                if isinstance(row.get(field), str):
+                    row[field] = date.fromisoformat(row[field])
+        except ValueError as e:
+            raise ValueError(f"Invalid date format: {e}")
+        rows.append(row)
+    return rows
+
+
+def _entry_fee_row(
+    number_entries: int,
+    fee_amount: str,
+    flat_rate: str | None = None,
+    commission_percent: str | None = None,
+) -> dict:
+    """Validate one entry fee tier and convert its amounts to Decimal."""
+    try:
+        fee_decimal = Decimal(fee_amount)
+        if fee_decimal < 0:
+            raise ValueError("Fee amount cannot be negative")
+            
+        flat_decimal = Decimal(flat_rate) if flat_rate else None
+        if flat_decimal is not None and flat_decimal < 0:
+            raise ValueError("Flat rate cannot be negative")
+            
+        commission_decimal = Decimal(commission_percent) if commission_percent else None
+        if commission_decimal is not None and (commission_decimal < 0 or commission_decimal > 100):
+            raise ValueError("Commission percent must be between 0 and 100")
+            
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid numeric value: {e}")
+    
+    return {
+        "number_entries": number_entries,
+        "fee_amount": fee_decimal,
+        "flat_rate": flat_decimal,
+        "commission_percent": commission_decimal,
+    }
+
+
+def _prize_row(
+    prize_rank: int | None = None,
+    prize_amount: str | None = None,
+    prize_type: str | None = None,
+    prize_description: str | None = None,
+) -> dict:
+    """Validate one prize and convert its amount to Decimal."""
+    # Validate prize amount if provided
+    amount_decimal = None
+    if prize_amount:
+        try:
+            amount_decimal = Decimal(prize_amount)
+            if amount_decimal < 0:
+                raise ValueError("Prize amount cannot be negative")
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid prize amount: {e}")
+    
+    # Validate prize rank if provided  
+    if prize_rank is not None and prize_rank < 1:
+        raise ValueError("Prize rank must be positive")
+    
+    return {
+        "prize_rank": prize_rank,
+        "prize_amount": amount_decimal,
+        "prize_type": prize_type,
+        "prize_description": prize_description,
+    }
+
+
+# ───────────────────────── RESULT SHAPING ─────────────────────────
+def _summarize_exhibition(exhibition) -> dict:
+    """Shape an Exhibition row into the compact dict returned by bulk inserts."""
+    return {
+        "id": exhibition.id,
+        "title": exhibition.title,
+        "date_start": str(exhibition.date_start),
+        "date_end": str(exhibition.date_end),
+        "venue": exhibition.venue,
+        "location": exhibition.location
+    }
+
+
+def _serialize_exhibition(exhibition) -> dict:
+    """Shape an Exhibition row (with eager-loaded fees and prizes) into a JSON-ready dict."""
+    return {
+        "id": exhibition.id,
+        "title": exhibition.title,
+        "date_start": str(exhibition.date_start),
+        "date_end": str(exhibition.date_end),
+        "venue": exhibition.venue,
+        "location": exhibition.location,
+        "county": exhibition.county,
+        "description": exhibition.description,
+        "entry_fees": [
+            {
+                "id": fee.id,
+                "number_entries": fee.number_entries,
+                "fee_amount": float(fee.fee_amount) if fee.fee_amount else None,
+                "fee_type": fee.fee_type,
+                "commission_percent": float(fee.commission_percent) if fee.commission_percent else None
+            }
+            for fee in exhibition.entry_fees
+        ],
+        "prizes": [
+            {
+                "id": prize.id,
+                "prize_rank": prize.prize_rank,
+                "prize_amount": float(prize.prize_amount) if prize.prize_amount else None,
+                "prize_type": prize.prize_type,
+                "prize_description": prize.prize_description
+            }
+            for prize in exhibition.prizes
+        ]
+    }
+
+
 # ───────────────────────────── URL ──────────────────────────────
 @tool
 @async_retry(max_retries=3)
@@ -298,6 +423,26 @@ async def get_unprocessed_urls_async(limit: int = 50) -> str:
     except Exception as e:
         return f"ERROR: Failed to get unprocessed URLs: {str(e)}"
 
+@functools.lru_cache(maxsize=32)
+def _describe_schema_cached(table_name: str) -> str:
+    """
+    Introspect a table once and memoize the result.
+    The schema does not change at runtime, so repeated agent calls skip the PRAGMA round-trips.
+    Unknown tables raise LookupError, which lru_cache does not store.
+    """
+    # A fresh inspector per miss: an Inspector memoizes table names, which would pin a missing table
+    inspector = inspect(get_sync_db_manager().engine)
+    
+    table_names = inspector.get_table_names()
+    
+    if table_name not in table_names:
+        raise LookupError(f"no table named '{table_name}'. Available: {table_names}")
+    
+    cols = inspector.get_columns(table_name)
+    lines = [f"{c['name']}: {c['type']}" for c in cols]
+    return "\n".join(lines)
+
+
 @tool
 def describe_schema(table_name: str) -> str:
     """
@@ -310,19 +455,10 @@ def describe_schema(table_name: str) -> str:
         A string containing the table schema with column names and types, or an error message if the operation fails.
     """
     try:
-        from sqlalchemy import create_engine, inspect
-        engine = create_engine("sqlite:///art_events.db")
-        inspector = inspect(engine)
-        
-        table_names = inspector.get_table_names()
-        
-        if table_name not in table_names:
-            return f"ERROR: no table named '{table_name}'. Available: {table_names}"
-        
-        cols = inspector.get_columns(table_name)
-        lines = [f"{c['name']}: {c['type']}" for c in cols]
-        return "\n".join(lines)
+        return _describe_schema_cached(table_name)
         
+    except LookupError as e:
+        return f"ERROR: {e}"
     except Exception as e:
         return f"ERROR: Failed to describe schema: {str(e)}"
     
@@ -500,31 +636,10 @@ def add_entry_fee(
     Returns:
         An integer representing the ID of the new EntryFee row.
     """
-    # Validate numeric inputs
-    try:
-        fee_decimal = Decimal(fee_amount)
-        if fee_decimal < 0:
-            raise ValueError("Fee amount cannot be negative")
-            
-        flat_decimal = Decimal(flat_rate) if flat_rate else None
-        if flat_decimal is not None and flat_decimal < 0:
-            raise ValueError("Flat rate cannot be negative")
-            
-        commission_decimal = Decimal(commission_percent) if commission_percent else None
-        if commission_decimal is not None and (commission_decimal < 0 or commission_decimal > 100):
-            raise ValueError("Commission percent must be between 0 and 100")
-            
-    except (ValueError, TypeError) as e:
-        raise ValueError(f"Invalid numeric value: {e}")
+    row = _entry_fee_row(number_entries, fee_amount, flat_rate, commission_percent)
 
     db = get_sync_db_manager()
-    result = db.add_entry_fee(
-        exhibition_id=exhibition_id,
-        number_entries=number_entries,
-        fee_amount=fee_decimal,
-        flat_rate=flat_decimal,
-        commission_percent=commission_decimal,
-    )
+    result = db.add_entry_fee(exhibition_id=exhibition_id, **row)
     return result.id
 
 
@@ -549,31 +664,55 @@ def add_prize(
     Returns:
         An integer representing the ID of the new Prize row.
     """
-    # Validate prize amount if provided
-    amount_decimal = None
-    if prize_amount:
-        try:
-            amount_decimal = Decimal(prize_amount)
-            if amount_decimal < 0:
-                raise ValueError("Prize amount cannot be negative")
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"Invalid prize amount: {e}")
-    
-    # Validate prize rank if provided  
-    if prize_rank is not None and prize_rank < 1:
-        raise ValueError("Prize rank must be positive")
+    row = _prize_row(prize_rank, prize_amount, prize_type, prize_description)
 
     db = get_sync_db_manager()
-    result = db.add_prize(
-        exhibition_id=exhibition_id,
-        prize_rank=prize_rank,
-        prize_amount=amount_decimal,
-        prize_type=prize_type,
-        prize_description=prize_description,
-    )
+    result = db.add_prize(exhibition_id=exhibition_id, **row)
     return result.id
 
 
+@tool
+def add_fees_and_prizes(
+    exhibition_id: int,
+    entry_fees: list[dict],
+    prizes: list[dict],
+) -> str:
+    """
+    Insert all entry fee tiers and prizes of one exhibition in a single transaction (synchronous implementation).
+    Prefer this over repeated add_entry_fee / add_prize calls when an exhibition has several of each.
+    
+    Args:
+        exhibition_id (int): Foreign‑key to the parent exhibition.
+        entry_fees (list[dict]): Fee tiers, each with "number_entries" and "fee_amount", and optionally
+            "flat_rate" and "commission_percent" (amounts as strings, e.g. "25.00").
+        prizes (list[dict]): Prizes, each with any of "prize_rank", "prize_amount", "prize_type"
+            and "prize_description".
+        
+    Returns:
+        A JSON string with the IDs of the entry fee and prize rows. Nothing is written if any row is invalid.
+    """
+    try:
+        fee_rows = [_entry_fee_row(**fee) for fee in entry_fees]
+        prize_rows = [_prize_row(**prize) for prize in prizes]
+        
+        db = get_sync_db_manager()
+        fees, added_prizes = db.add_fees_and_prizes(exhibition_id, fee_rows, prize_rows)
+        
+        return json.dumps({
+            "success": True,
+            "entry_fee_ids": [fee.id for fee in fees],
+            "prize_ids": [prize.id for prize in added_prizes]
+        }, indent=2)
+        
+    except Exception as e:
+        return json.dumps({
+            "success": False,
+            "error": str(e),
+            "entry_fee_ids": [],
+            "prize_ids": []
+        }, indent=2)
+
+
 @tool
 def get_unprocessed_urls(limit: int = 50) -> str:
     """
@@ -691,18 +830,8 @@ async def bulk_insert_exhibitions_async(exhibitions_data_json: str) -> str:
         exhibitions_data = json.loads(exhibitions_data_json)
         
         db = await get_async_db_manager()
-        results = await db.bulk_insert_exhibitions(exhibitions_data)
-        
-        result_data = []
-        for exhibition in results:
-            result_data.append({
-                "id": exhibition.id,
-                "title": exhibition.title,
-                "date_start": str(exhibition.date_start),
-                "date_end": str(exhibition.date_end),
-                "venue": exhibition.venue,
-                "location": exhibition.location
-            })
+        results = await db.bulk_insert_exhibitions(_prepare_exhibition_rows(exhibitions_data))
+        result_data = [_summarize_exhibition(exhibition) for exhibition in results]
         
         return json.dumps({
             "success": True,
@@ -756,42 +885,7 @@ async def get_exhibitions_by_criteria_async(
             fee_range=fee_range
         )
         
-        result_data = []
-        for exhibition in exhibitions:
-            exhibition_data = {
-                "id": exhibition.id,
-                "title": exhibition.title,
-                "date_start": str(exhibition.date_start),
-                "date_end": str(exhibition.date_end),
-                "venue": exhibition.venue,
-                "location": exhibition.location,
-                "county": exhibition.county,
-                "description": exhibition.description,
-                "entry_fees": [],
-                "prizes": []
-            }
-            
-            # Add entry fees if loaded
-            for fee in exhibition.entry_fees:
-                exhibition_data["entry_fees"].append({
-                    "id": fee.id,
-                    "number_entries": fee.number_entries,
-                    "fee_amount": float(fee.fee_amount) if fee.fee_amount else None,
-                    "fee_type": fee.fee_type,
-                    "commission_percent": float(fee.commission_percent) if fee.commission_percent else None
-                })
-            
-            # Add prizes if loaded
-            for prize in exhibition.prizes:
-                exhibition_data["prizes"].append({
-                    "id": prize.id,
-                    "prize_rank": prize.prize_rank,
-                    "prize_amount": float(prize.prize_amount) if prize.prize_amount else None,
-                    "prize_type": prize.prize_type,
-                    "prize_description": prize.prize_description
-                })
-            
-            result_data.append(exhibition_data)
+        result_data = [_serialize_exhibition(exhibition) for exhibition in exhibitions]
         
         return json.dumps({
             "success": True,
@@ -917,18 +1011,8 @@ def bulk_insert_exhibitions(exhibitions_data_json: str) -> str:
         exhibitions_data = json.loads(exhibitions_data_json)
         
         db = get_sync_db_manager()
-        results = db.bulk_insert_exhibitions(exhibitions_data)
-        
-        result_data = []
-        for exhibition in results:
-            result_data.append({
-                "id": exhibition.id,
-                "title": exhibition.title,
-                "date_start": str(exhibition.date_start),
-                "date_end": str(exhibition.date_end),
-                "venue": exhibition.venue,
-                "location": exhibition.location
-            })
+        results = db.bulk_insert_exhibitions(_prepare_exhibition_rows(exhibitions_data))
+        result_data = [_summarize_exhibition(exhibition) for exhibition in results]
         
         return json.dumps({
             "success": True,
@@ -979,42 +1063,7 @@ def get_exhibitions_by_criteria(
             fee_range=fee_range
         )
         
-        result_data = []
-        for exhibition in exhibitions:
-            exhibition_data = {
-                "id": exhibition.id,
-                "title": exhibition.title,
-                "date_start": str(exhibition.date_start),
-                "date_end": str(exhibition.date_end),
-                "venue": exhibition.venue,
-                "location": exhibition.location,
-                "county": exhibition.county,
-                "description": exhibition.description,
-                "entry_fees": [],
-                "prizes": []
-            }
-            
-            # Add entry fees if loaded
-            for fee in exhibition.entry_fees:
-                exhibition_data["entry_fees"].append({
-                    "id": fee.id,
-                    "number_entries": fee.number_entries,
-                    "fee_amount": float(fee.fee_amount) if fee.fee_amount else None,
-                    "fee_type": fee.fee_type,
-                    "commission_percent": float(fee.commission_percent) if fee.commission_percent else None
-                })
-            
-            # Add prizes if loaded
-            for prize in exhibition.prizes:
-                exhibition_data["prizes"].append({
-                    "id": prize.id,
-                    "prize_rank": prize.prize_rank,
-                    "prize_amount": float(prize.prize_amount) if prize.prize_amount else None,
-                    "prize_type": prize.prize_type,
-                    "prize_description": prize.prize_description
-                })
-            
-            result_data.append(exhibition_data)
+        result_data = [_serialize_exhibition(exhibition) for exhibition in exhibitions]
         
         return json.dumps({
             "success": True,
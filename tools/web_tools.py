@@ -3,19 +3,35 @@ Enhanced web scraping tools with proper rate limiting and anti-bot measures.
 According to web scraping best practices: Use rate limiting, proxy rotation, and proper error handling.
 """
 import asyncio
-import atexit
+import codecs
+import functools
+import hashlib
+import itertools
+import json
+import os
 import random
+import re
+import socket
+import threading
 import time
+import weakref
 from typing import Optional
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from contextlib import asynccontextmanager
+from pathlib import Path
+from urllib.parse import urlsplit
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 from smolagents import tool
 import helium
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -30,6 +46,17 @@ class ScrapingConfig:
     max_delay: float = 8.0  # Maximum delay between requests
     timeout: int = 30       # Request timeout in seconds
     max_retries: int = 3    # Maximum retry attempts
+    backoff_base: float = 1.0  # Shortest sleep before a retry, in seconds
+    backoff_cap: float = 30.0  # Longest sleep before a retry, including server-requested ones
+    max_concurrency: int = 64  # Maximum requests in flight across all hosts
+    max_per_host: int = 8      # Maximum requests in flight to a single host
+    host_burst: int = 4        # Requests a host may receive back-to-back before pacing applies
+    # On-disk page cache shared across agent runs, under the project rather than the working directory
+    cache_dir: str = str(Path(__file__).resolve().parent.parent / ".cache" / "http")
+    cache_ttl: int = 86400  # Seconds before a cached page is refetched
+    cache_max_entries: int = 1024  # Pages kept on disk; each holds at most max_body_bytes
+    max_body_bytes: int = 262144  # Bytes of body read per page; output is capped at 10k chars anyway
+    max_content_length: int = 5 * 1024 * 1024  # Declared sizes above this are skipped unread
     user_agents: list[str] = None  # List of user agents to rotate
     
     def __post_init__(self):
@@ -42,6 +69,161 @@ class ScrapingConfig:
             ]
 
 
+# Process-wide DNS cache: scrapes hit the same few hosts over and over, and neither
+# requests nor httpx cache lookups. Failures are remembered briefly so a transient
+# NXDOMAIN is retried soon rather than pinned.
+_socket_getaddrinfo = socket.getaddrinfo
+_dns_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+_dns_failures: TTLCache = TTLCache(maxsize=1024, ttl=5)
+_dns_lock = threading.Lock()
+
+
+def _cached_getaddrinfo(*args, **kwargs):
+    """socket.getaddrinfo with TTL caching of both answers and failures."""
+    key = (args, tuple(sorted(kwargs.items())))
+    with _dns_lock:
+        addresses = _dns_cache.get(key)
+        failure = _dns_failures.get(key)
+    
+    if addresses is not None:
+        return list(addresses)
+    if failure is not None:
+        raise socket.gaierror(*failure)
+    
+    # Resolve outside the lock; lookups run concurrently in executor threads
+    try:
+        addresses = _socket_getaddrinfo(*args, **kwargs)
+    except socket.gaierror as e:
+        with _dns_lock:
+            _dns_failures[key] = e.args
+        raise
+    
+    with _dns_lock:
+        _dns_cache[key] = tuple(addresses)
+    return addresses
+
+
+def _install_dns_cache() -> None:
+    """Route socket.getaddrinfo through the DNS cache; safe to call repeatedly."""
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+@dataclass
+class FetchedPage:
+    """A fetched page body and the validators used to revalidate it once its cached copy is stale."""
+    html: str
+    etag: str = ''
+    last_modified: str = ''
+
+
+class PageStore:
+    """
+    On-disk page cache shared across agent runs, one JSON file per URL.
+    Only bodies the scraper has already read are written, so an entry never exceeds
+    ``max_body_bytes``; the oldest entries are removed once there are more than ``max_entries``.
+    Entries older than ``ttl`` are kept as stale copies to revalidate with a conditional GET.
+    Methods block on file I/O; async callers run them in worker threads.
+    """
+    
+    def __init__(self, path: Path, ttl: float, max_entries: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._count: Optional[int] = None
+        self._count_lock = threading.Lock()  # Writes run concurrently in worker threads
+    
+    def _file_for(self, url: str) -> Path:
+        return self.path / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.json"
+    
+    def get(self, url: str) -> Optional[tuple[FetchedPage, bool]]:
+        """The stored page for a URL and whether it is younger than ``ttl``, or None if there is none."""
+        file = self._file_for(url)
+        try:
+            fresh = time.time() - file.stat().st_mtime <= self.ttl
+            entry = json.loads(file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        
+        if entry.get('url') != url:
+            return None
+        return FetchedPage(entry['html'], entry['etag'], entry['last_modified']), fresh
+    
+    def touch(self, url: str) -> None:
+        """Mark a stored page fresh again after the server confirmed it is unchanged."""
+        try:
+            os.utime(self._file_for(url))
+        except OSError:
+            pass
+    
+    def set(self, url: str, page: FetchedPage) -> None:
+        """Store a page, evicting the oldest entries if the store is over its bound."""
+        file = self._file_for(url)
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            is_new = not file.exists()
+            
+            # Write then rename, so readers in other threads and processes never see a partial file
+            partial = file.with_suffix(f'.{os.getpid()}-{threading.get_ident()}.tmp')
+            partial.write_text(json.dumps({
+                'url': url, 'html': page.html, 'etag': page.etag, 'last_modified': page.last_modified,
+            }), encoding='utf-8')
+            partial.replace(file)
+        except OSError as e:
+            print(f"Could not cache {url}: {e}")
+            return
+        
+        if is_new:
+            with self._count_lock:
+                if self._count is None:
+                    self._count = sum(1 for _ in self.path.glob('*.json'))
+                else:
+                    self._count += 1
+                if self._count > self.max_entries:
+                    self._evict()
+    
+    def _evict(self) -> None:
+        """Remove the oldest entries, down to 90% of the bound so eviction doesn't run on every write."""
+        def mtime(file: Path) -> float:
+            try:
+                return file.stat().st_mtime
+            except OSError:
+                return 0.0
+        
+        files = sorted(self.path.glob('*.json'), key=mtime)
+        excess = len(files) - int(self.max_entries * 0.9)
+        for file in files[:max(excess, 0)]:
+            file.unlink(missing_ok=True)
+        self._count = len(files) - max(excess, 0)
+
+
+class TokenBucket:
+    """
+    Async token bucket: refills at `rate` tokens per second up to `capacity`.
+    Callers only wait when the bucket is empty, and waiters are served in order.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: float = 1) -> None:
+        """Take `tokens` from the bucket, sleeping until enough have accrued."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            
+            if self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._tokens = tokens
+                self._last_refill = time.monotonic()
+            
+            self._tokens -= tokens
+
+
 class RateLimitedScraper:
     """
     Rate-limited web scraper following best practices.
@@ -50,116 +232,490 @@ class RateLimitedScraper:
     
     def __init__(self, config: Optional[ScrapingConfig] = None):
         self.config = config or ScrapingConfig()
-        self.last_request_time = 0.0
-        self.session = requests.Session()
+        _install_dns_cache()
         
-        # Set a default user agent
-        self.session.headers.update({
-            'User-Agent': random.choice(self.config.user_agents)
-        })
-    
-    async def _wait_for_rate_limit(self) -> None:
-        """Implement rate limiting with randomized delays."""
-        elapsed = time.time() - self.last_request_time
-        delay = random.uniform(self.config.min_delay, self.config.max_delay)
+        # Deterministic rotation spreads requests evenly across the configured user agents
+        self._ua_cycle = itertools.cycle(self.config.user_agents)
+        
+        # Native async client: HTTP/2 multiplexing and a keep-alive pool shared across scrapes
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=self.config.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.config.max_concurrency, max_keepalive_connections=32),
+            headers={'User-Agent': next(self._ua_cycle)},
+        )
+        
+        # Politeness is enforced per host so different sites can be scraped concurrently
+        self._host_buckets: dict[str, TokenBucket] = {}
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._request_slots = asyncio.Semaphore(self.config.max_concurrency)
+        self._host_cache: dict[str, str] = {}
         
-        if elapsed < delay:
-            wait_time = delay - elapsed
-            await asyncio.sleep(wait_time)
+        # Pages already read are persisted on disk so repeated runs re-read them locally
+        self.store = PageStore(Path(self.config.cache_dir), self.config.cache_ttl, self.config.cache_max_entries)
+        
+        # Close the client when the scraper is collected or at interpreter exit, at most once,
+        # on the loop its connections were opened on
+        self._finalizer = weakref.finalize(self, _close_client, self.client, _running_loop())
+    
+    def _host_of(self, url: str) -> str:
+        """Host of a URL, memoized because agents fetch the same URLs repeatedly."""
+        host = self._host_cache.get(url)
+        if host is None:
+            # FIFO eviction at 1024 entries: dicts keep insertion order, so the first key is the oldest
+            if len(self._host_cache) >= 1024:
+                del self._host_cache[next(iter(self._host_cache))]
+            host = self._host_cache[url] = urlsplit(url).netloc
+        return host
+    
+    async def _wait_for_rate_limit(self, url: str) -> None:
+        """Take a token from the URL host's bucket, waiting only if it is empty."""
+        host = self._host_of(url)
+        bucket = self._host_buckets.get(host)
+        if bucket is None:
+            # Refill at the mean configured delay, allowing short bursts per host
+            mean_delay = (self.config.min_delay + self.config.max_delay) / 2
+            bucket = self._host_buckets[host] = TokenBucket(rate=1 / mean_delay, capacity=self.config.host_burst)
+        await bucket.acquire()
     
-    async def scrape_url(self, url: str, **kwargs) -> Optional[str]:
+    async def scrape_url(self, url: str, use_cache: bool = True, **kwargs) -> Optional[FetchedPage]:
         """
         Scrape URL with proper rate limiting and error handling.
         According to best practices: Implement exponential backoff and proper error handling.
+        With ``use_cache`` a page stored on disk within ``cache_ttl`` is returned without a request,
+        and an older one is revalidated with a conditional GET instead of downloaded again.
         """
-        await self._wait_for_rate_limit()
+        # The store does blocking file I/O; keep it off the event loop
+        stored = await asyncio.to_thread(self.store.get, url) if use_cache else None
+        if stored is not None and stored[1]:
+            return stored[0]
+        etag, last_modified = (stored[0].etag, stored[0].last_modified) if stored else ('', '')
+        
+        await self._wait_for_rate_limit(url)
+        backoff = self.config.backoff_base
         
         for attempt in range(self.config.max_retries):
+            retry_after = None
             try:
                 # Rotate user agent for each request
-                self.session.headers.update({
-                    'User-Agent': random.choice(self.config.user_agents)
-                })
+                headers = {'User-Agent': next(self._ua_cycle)}
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
                 
-                response = self.session.get(
-                    url, 
-                    timeout=self.config.timeout,
-                    **kwargs
-                )
-                response.raise_for_status()
+                host_slots = self._host_slots.setdefault(
+                    self._host_of(url), asyncio.Semaphore(self.config.max_per_host))
                 
-                self.last_request_time = time.time()
-                return response.text
+                # Queue here rather than in the pool, where waiting would count against the timeout
+                async with host_slots, self._request_slots:
+                    async with self.client.stream('GET', url, headers=headers, **kwargs) as response:
+                        if response.status_code == 304 and stored:
+                            await asyncio.to_thread(self.store.touch, url)
+                            return stored[0]
+                        response.raise_for_status()
+                        
+                        # Decide from the headers alone; PDFs, images and huge files are dropped before their body is read
+                        skip_reason = _unscrapable_reason(response.headers, self.config.max_content_length)
+                        if skip_reason:
+                            print(f"Skipping {url}: {skip_reason}")
+                            return None
+                        
+                        page = FetchedPage(
+                            await self._read_capped(response),
+                            response.headers.get('ETag', ''),
+                            response.headers.get('Last-Modified', ''),
+                        )
+                        await asyncio.to_thread(self.store.set, url, page)
+                        return page
                 
-            except requests.exceptions.RequestException as e:
-                if attempt == self.config.max_retries - 1:
-                    print(f"Failed to scrape {url} after {self.config.max_retries} attempts: {e}")
+            except httpx.HTTPStatusError as e:
+                # Other client errors won't improve on a second attempt
+                if e.response.status_code not in _RETRYABLE_STATUSES:
+                    print(f"Failed to scrape {url}: {e}")
                     return None
-                
-                # Exponential backoff with jitter
-                backoff = (2 ** attempt) + random.uniform(0, 1)
-                await asyncio.sleep(backoff)
+                retry_after = _parse_retry_after(e.response.headers.get('Retry-After', ''))
+                error = e
+            except httpx.HTTPError as e:
+                error = e
+            
+            if attempt == self.config.max_retries - 1:
+                print(f"Failed to scrape {url} after {self.config.max_retries} attempts: {error}")
+                return None
+            
+            # Decorrelated jitter keeps concurrent scrapers that failed together from retrying together;
+            # a server-supplied Retry-After takes precedence
+            backoff = min(self.config.backoff_cap, random.uniform(self.config.backoff_base, backoff * 3))
+            delay = backoff if retry_after is None else min(retry_after, self.config.backoff_cap)
+            await asyncio.sleep(delay)
+        
+        return None
+    
+    async def _read_capped(self, response: httpx.Response) -> str:
+        """Read at most ``max_body_bytes`` of a streamed body and decode it."""
+        limit = self.config.max_body_bytes
+        chunks = []
+        received = 0
+        
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            received += len(chunk)
+            if received >= limit:
+                break
         
+        content = b''.join(chunks)[:limit]
+        return _decode_body(content, response.headers.get('Content-Type', ''), truncated=received >= limit)
+    
+    async def close(self):
+        """Close the client and its connection pool properly."""
+        await self.client.aclose()
+
+
+# Link targets that never lead to another page worth scraping
+_HREF_SKIP = re.compile(r'(?:#|javascript:|mailto:|tel:|data:|about:)', re.IGNORECASE)
+
+
+# charset parameter of a Content-Type header
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# charset declared in the document itself, by <meta charset> or <meta http-equiv="Content-Type">
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+# Statuses that are worth retrying: rate limiting and transient server or gateway failures
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Seconds to wait from a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _unscrapable_reason(headers, max_content_length: int) -> Optional[str]:
+    """Return why a response should not be read, judging by its headers, or None if it is HTML."""
+    content_type = headers.get('Content-Type', '')
+    if content_type and 'html' not in content_type.lower():
+        return f"unsupported content type {content_type}"
+    
+    content_length = headers.get('Content-Length', '')
+    if content_length.isdigit() and int(content_length) > max_content_length:
+        return f"body of {content_length} bytes exceeds {max_content_length}"
+    
+    return None
+
+
+def _decode_body(content: bytes, content_type: str, truncated: bool = False) -> str:
+    """
+    Decode a response body once, using the header charset if there is one.
+    Otherwise try strict UTF-8, then the document's <meta> charset, then cp1252, which most
+    undeclared legacy pages are and which decodes every byte.
+    ``truncated`` says the body was cut at the read cap, possibly inside a UTF-8 character.
+    Avoids requests' ISO-8859-1 default and its charset sniffing over the whole body.
+    """
+    match = _CHARSET_RE.search(content_type)
+    if match:
+        try:
+            return content.decode(match.group(1), errors='replace')
+        except LookupError:
+            pass
+    
+    # A capped body may end in the middle of a multi-byte character; drop that partial tail only then
+    try:
+        return codecs.getincrementaldecoder('utf-8')().decode(content, final=not truncated)
+    except UnicodeDecodeError:
+        pass
+    
+    match = _META_CHARSET_RE.search(content, 0, 4096)
+    if match:
+        try:
+            return content.decode(match.group(1).decode('ascii'), errors='replace')
+        except LookupError:
+            pass
+    
+    return content.decode('cp1252', errors='replace')
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """The event loop running in this thread, if any."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
         return None
+
+
+# Close tasks scheduled from synchronous code, referenced until they finish so they aren't collected
+_closing_tasks: set[asyncio.Task] = set()
+
+
+def _close_client(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close an async client from synchronous code, on the event loop it was used on."""
+    if client.is_closed:
+        return
+    
+    # Nothing can be awaited on a finished loop, typically at exit after asyncio.run();
+    # the sockets are released with the process
+    if loop is not None and loop.is_closed():
+        return
     
-    def close(self):
-        """Close the session properly."""
-        self.session.close()
+    try:
+        if loop is None:
+            asyncio.run(client.aclose())
+        elif not loop.is_running():
+            loop.run_until_complete(client.aclose())
+        elif _running_loop() is loop:
+            task = loop.create_task(client.aclose())
+            _closing_tasks.add(task)
+            task.add_done_callback(_closing_tasks.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    except Exception as e:
+        print(f"Error closing scraper: {e}")
+
+
+# One scraper per event loop, created on first use so importers that never scrape pay nothing.
+# The client's connections, locks and semaphores belong to the loop they were first used on,
+# and every asyncio.run() starts a new one.
+_scrapers: dict[asyncio.AbstractEventLoop, RateLimitedScraper] = {}
+_scrapers_lock = threading.Lock()
+
 
+def _get_scraper() -> RateLimitedScraper:
+    """Get or create the scraper for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _scrapers_lock:
+        scraper = _scrapers.get(loop)
+        if scraper is None:
+            # Drop scrapers whose loops have finished instead of keeping their dead pools
+            for finished in [other for other in _scrapers if other.is_closed()]:
+                _scrapers.pop(finished)._finalizer()
+            scraper = _scrapers[loop] = RateLimitedScraper()
+    return scraper
 
-# Global scraper instance
-_scraper = RateLimitedScraper()
+# Exhibition pages change slowly: keep fetched HTML for an hour, and remember
+# failures briefly so repeated agent calls don't trigger retry storms
+_page_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+_failed_urls: TTLCache = TTLCache(maxsize=512, ttl=60)
+
+# BLAKE2b digest of extracted page text and links -> first URL it was seen at.
+# Bounded and expiring like the page cache, so a later crawl sees the pages afresh.
+_seen_content: TTLCache = TTLCache(maxsize=1024, ttl=3600)
 
 
 @tool
-async def scrape_website_safely(url: str) -> str:
+async def scrape_website_safely(url: str, no_cache: bool = False) -> str:
     """
     Enhanced website scraping with rate limiting and error handling.
     
     Args:
         url (str): The URL to scrape for text and links.
+        no_cache (bool): Bypass the in-memory and on-disk page caches and fetch a fresh copy (default: False).
         
     Returns:
         A string containing the extracted text content and links from the website.
         Returns an error message string if scraping fails.
     """
     try:
-        html_content = await _scraper.scrape_url(url)
-        if not html_content:
-            return f"Failed to scrape {url} - no content retrieved"
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
+        html_content = None if no_cache else _page_cache.get(url)
         
-        # Extract text content more efficiently
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        if html_content is None:
+            if not no_cache and url in _failed_urls:
+                return f"Failed to scrape {url} - no content retrieved (recent failure, not retried)"
+            
+            page = await _get_scraper().scrape_url(url, use_cache=not no_cache)
+            if page is None or not page.html:
+                _failed_urls[url] = True
+                return f"Failed to scrape {url} - no content retrieved"
+            
+            html_content = page.html
+            _page_cache[url] = html_content
         
-        text_content = soup.get_text(strip=True, separator=' ')
+        text_content, links = _extract_text_and_links(html_content)
+        links = list(links)
         
-        # Extract all links with better filtering
-        links = []
-        for link in soup.find_all('a', href=True):
-            # Ensure we have a Tag element that supports the get method
-            if hasattr(link, 'get'):
-                href = link.get('href')
-                if href and not href.startswith(('#', 'javascript:', 'mailto:')):
-                    links.append(href)
+        # Mirror pages would cost tokens for nothing; report them compactly. Pages without text
+        # (script-rendered shells, link hubs) are never treated as duplicates.
+        if text_content:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(text_content.encode())
+            for link in links:
+                digest.update(b'\0' + link.encode())
+            first_url = _seen_content.setdefault(digest.digest(), url)
+            if first_url != url:
+                return f"Duplicate content of {first_url}"
         
         # Limit output size to prevent token overflow
-        if len(text_content) > 10000:
-            text_content = text_content[:10000] + "... [TRUNCATED]"
+        if len(text_content) > _MAX_TEXT_CHARS:
+            text_content = text_content[:_MAX_TEXT_CHARS] + "... [TRUNCATED]"
         
-        if len(links) > 50:
-            links = links[:50] + ["... [MORE LINKS TRUNCATED]"]
+        if len(links) > _MAX_LINKS:
+            links = links[:_MAX_LINKS] + ["... [MORE LINKS TRUNCATED]"]
         
-        result = f"Text Content:\n{text_content}\n\nLinks:\n" + '\n'.join(links)
-        return result
+        return f"Text Content:\n{text_content}\n\nLinks:\n" + '\n'.join(links)
         
     except Exception as e:
         return f"Error scraping {url}: {str(e)}"
 
 
+@tool
+async def scrape_websites_safely(urls: list[str], no_cache: bool = False) -> list[str]:
+    """
+    Scrape several websites concurrently, with the same rate limiting and caching as scrape_website_safely.
+    
+    Args:
+        urls (list[str]): The URLs to scrape for text and links.
+        no_cache (bool): Bypass the in-memory and on-disk page caches and fetch fresh copies (default: False).
+        
+    Returns:
+        A list with one result string per URL, in the same order as the input URLs.
+    """
+    # Per-host token buckets keep each site polite; this only bounds the batch as a whole
+    slots = asyncio.Semaphore(8)
+    
+    async def scrape_one(url: str) -> str:
+        async with slots:
+            return await scrape_website_safely(url, no_cache=no_cache)
+    
+    return list(await asyncio.gather(*(scrape_one(url) for url in urls)))
+
+
+# Output caps shared by the scraping tools; extraction stops just past them
+_MAX_TEXT_CHARS = 10000
+_MAX_LINKS = 50
+
+def _join_words(words) -> str:
+    """Join words with single spaces, stopping once the result is longer than _MAX_TEXT_CHARS."""
+    parts = []
+    length = -1
+    for word in words:
+        parts.append(word)
+        length += len(word) + 1
+        if length > _MAX_TEXT_CHARS:
+            break
+    return ' '.join(parts)
+
+
+# Elements whose text is never visible
+_INVISIBLE_TAGS = frozenset(('script', 'style', 'noscript', 'template'))
+
+
+def _lxml_text_and_links(html_content: str) -> tuple[str, list[str]]:
+    """
+    Collect text and hrefs in a single lxml walk over the body.
+    Text is taken on 'start' and tails on 'end' so document order is preserved.
+    """
+    # Parse bytes: lxml rejects str input that carries an XML encoding declaration
+    root = etree.fromstring(html_content.encode('utf-8'), etree.HTMLParser(encoding='utf-8'))
+    if root is None:
+        return '', []
+    body = root.find('body')
+    
+    words = []
+    text_len = -1  # Length of the words joined by single spaces
+    links = []
+    skip = _HREF_SKIP.match
+    skipping = 0
+    
+    def take(fragment: str) -> None:
+        nonlocal text_len
+        new_words = fragment.split()
+        words.extend(new_words)
+        text_len += sum(map(len, new_words)) + len(new_words)
+    
+    events = ('start', 'end', 'comment', 'pi')
+    for event, el in etree.iterwalk(body if body is not None else root, events=events):
+        # Stop as soon as both outputs are past what the callers will keep
+        if text_len > _MAX_TEXT_CHARS and len(links) > _MAX_LINKS:
+            break
+        
+        if event == 'start':
+            if el.tag in _INVISIBLE_TAGS:
+                skipping += 1
+            elif not skipping:
+                if el.text and text_len <= _MAX_TEXT_CHARS:
+                    take(el.text)
+                if el.tag == 'a' and len(links) <= _MAX_LINKS:
+                    href = el.get('href')
+                    if href and not skip(href):
+                        links.append(href)
+            continue
+        
+        # Closing tags, comments and processing instructions are followed by their tail text
+        if event == 'end' and el.tag in _INVISIBLE_TAGS:
+            skipping -= 1
+        if el.tail and not skipping and text_len <= _MAX_TEXT_CHARS:
+            take(el.tail)
+    
+    return _join_words(words), links
+
+
+@functools.lru_cache(maxsize=128)
+def _extract_text_and_links(html_content: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Extract visible text and outbound links from an HTML document.
+    Uses the lexbor C parser from selectolax, falling back to a single lxml walk if it fails.
+    Results are memoized on the HTML itself, so cached pages are not re-parsed.
+    """
+    try:
+        tree = LexborHTMLParser(html_content)
+        
+        # Remove the same invisible elements the lxml fallback skips
+        for node in tree.css(', '.join(_INVISIBLE_TAGS)):
+            node.decompose()
+        
+        # Walk text nodes lazily so only the words up to the cap are ever materialized
+        root = tree.body or tree.root
+        nodes = root.traverse(include_text=True) if root else ()
+        texts = (node.text_content for node in nodes if node.tag == '-text')
+        text_content = _join_words(word for text in texts if text for word in text.split())
+        
+        skip = _HREF_SKIP.match
+        hrefs = (node.attributes.get('href') for node in tree.css('a[href]'))
+        links = list(itertools.islice((href for href in hrefs if href and not skip(href)), _MAX_LINKS + 1))
+        
+    except Exception:
+        text_content, links = _lxml_text_and_links(html_content)
+    
+    return text_content, tuple(links)
+
+
+# Chrome configuration shared by every browser the manager starts
+_CHROME_OPTS_ARGS = (
+    # New headless mode renders like a regular browser but without a UI or GPU process
+    "--headless=new",
+    # According to anti-detection best practices
+    "--force-device-scale-factor=1",
+    "--window-size=1000,1350",
+    "--disable-pdf-viewer",
+    "--window-position=0,0",
+    # Additional anti-detection measures
+    "--disable-blink-features=AutomationControlled",
+    # Performance optimizations
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    # Text extraction doesn't need images
+    "--blink-settings=imagesEnabled=false",
+)
+_CHROME_OPTS_EXPERIMENTAL = {
+    "excludeSwitches": ["enable-automation"],
+    "useAutomationExtension": False,
+    # 2 = block: skip downloading images and fonts, and suppress notification prompts.
+    # Stylesheets stay on: without them CSS-hidden modals and close buttons would count as visible.
+    "prefs": {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    },
+}
+
+
 class EnhancedBrowserManager:
     """
     Enhanced browser management with proper error handling and resource cleanup.
@@ -174,32 +730,29 @@ class EnhancedBrowserManager:
     def _setup_chrome_options(self):
         """Configure Chrome options for better scraping."""
         self.chrome_options = webdriver.ChromeOptions()
+        for argument in _CHROME_OPTS_ARGS:
+            self.chrome_options.add_argument(argument)
+        for name, value in _CHROME_OPTS_EXPERIMENTAL.items():
+            self.chrome_options.add_experimental_option(name, value)
         
-        # According to anti-detection best practices
-        self.chrome_options.add_argument("--force-device-scale-factor=1")
-        self.chrome_options.add_argument("--window-size=1000,1350")
-        self.chrome_options.add_argument("--disable-pdf-viewer")
-        self.chrome_options.add_argument("--window-position=0,0")
-        
-        # Additional anti-detection measures
-        self.chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        self.chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # Performance optimizations
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument("--disable-dev-shm-usage")
+        # Return from navigation at DOMContentLoaded instead of waiting for every subresource
+        self.chrome_options.page_load_strategy = 'eager'
     
     @asynccontextmanager
     async def get_browser(self):
         """Context manager for browser instances with proper cleanup."""
         try:
             if not self.driver:
+                # Headless mode comes from --headless=new in the options; helium's
+                # headless flag would append the legacy --headless switch after it
                 self.driver = helium.start_chrome(
                     headless=False, 
                     options=self.chrome_options
                 )
                 
+                # Quit the browser when the manager is collected or at interpreter exit
+                self._driver_finalizer = weakref.finalize(self, _quit_driver, self.driver)
+                
                 # Execute script to remove webdriver property
                 self.driver.execute_script(
                     "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
@@ -209,29 +762,45 @@ class EnhancedBrowserManager:
             
         except Exception as e:
             print(f"Browser error: {e}")
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except Exception as close_error:
-                    print(f"Error closing browser: {close_error}")
-                    pass
-                self.driver = None
+            self.close_browser()
             raise
     
     def close_browser(self):
         """Properly close browser and clean up resources."""
         if self.driver:
-            try:
-                self.driver.quit()
-            except Exception as e:
-                print(f"Error closing browser: {e}")
-                pass
-            finally:
-                self.driver = None
+            self._driver_finalizer()
+            self.driver = None
 
 
-# Global browser manager
-_browser_manager = EnhancedBrowserManager()
+def _quit_driver(driver: webdriver.Remote) -> None:
+    """Quit a WebDriver session, reporting rather than raising errors."""
+    try:
+        driver.quit()
+    except Exception as e:
+        print(f"Error closing browser: {e}")
+
+
+# Global browser manager, created on first use so importers that never browse pay nothing
+@functools.cache
+def _get_browser_manager() -> EnhancedBrowserManager:
+    """Get or create the global browser manager."""
+    return EnhancedBrowserManager()
+
+# Collect the elements whose own text nodes contain arguments[0], in document order
+_FIND_TEXT_SCRIPT = """
+const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+const found = [];
+const seen = new Set();
+let node;
+while ((node = walker.nextNode())) {
+    const parent = node.parentElement;
+    if (parent && !seen.has(parent) && node.nodeValue.includes(arguments[0])) {
+        seen.add(parent);
+        found.push(parent);
+    }
+}
+return found;
+"""
 
 
 @tool
@@ -258,10 +827,10 @@ def enhanced_search_item(text: str, nth_result: int = 1, timeout: int = 10) -> s
         # Wait for page to be ready
         wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
         
-        # Find elements with explicit wait
-        xpath = f"//*[contains(text(), '{text}')]"
+        # Find elements with explicit wait; the text search runs inside the browser
+        # in one round-trip, and the text is passed as an argument so no quoting is needed
         elements = wait.until(
-            EC.presence_of_all_elements_located((By.XPATH, xpath))
+            lambda d: d.execute_script(_FIND_TEXT_SCRIPT, text)
         )
         
         if nth_result > len(elements):
@@ -269,17 +838,11 @@ def enhanced_search_item(text: str, nth_result: int = 1, timeout: int = 10) -> s
         
         element = elements[nth_result - 1]
         
-        # Scroll to element with retry logic
-        for attempt in range(3):
-            try:
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-                # Wait a bit for smooth scrolling
-                time.sleep(1)
-                break
-            except Exception as e:
-                if attempt == 2:
-                    return f"Failed to scroll to element: {e}"
-                time.sleep(1)
+        # An instant scroll has finished by the time execute_script returns, so there is nothing to wait for
+        try:
+            driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", element)
+        except Exception as e:
+            return f"Failed to scroll to element: {e}"
         
         return f"Found {len(elements)} matches for '{text}'. Focused on element {nth_result} of {len(elements)}"
         
@@ -291,6 +854,29 @@ def enhanced_search_item(text: str, nth_result: int = 1, timeout: int = 10) -> s
         return f"Unexpected error while searching for '{text}': {str(e)}"
 
 
+# Common modal close buttons and backdrops, each as one grouped CSS selector
+_CLOSE_BUTTON_SELECTOR = (
+    "[data-dismiss='modal'], .modal-close, .close, [aria-label='Close'], .popup-close, [title='Close']"
+)
+_OVERLAY_SELECTOR = ".modal-backdrop, .overlay, .popup-overlay"
+
+# Return the visible matches for each selector in arguments, as one list per selector
+_FIND_POPUP_CONTROLS_SCRIPT = """
+const visible = (el) => el.getClientRects().length > 0;
+return Array.from(arguments, (selector) =>
+    Array.from(document.querySelectorAll(selector)).filter(visible)
+);
+"""
+
+
+def _wait_until_hidden(driver: webdriver.Remote, element, timeout: float = 1) -> None:
+    """Wait briefly for a clicked element to disappear; returns at once if it already has."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(EC.invisibility_of_element(element))
+    except TimeoutException:
+        pass
+
+
 @tool
 def enhanced_close_popups() -> str:
     """
@@ -313,41 +899,37 @@ def enhanced_close_popups() -> str:
         try:
             webdriver.ActionChains(driver).send_keys(Keys.ESCAPE).perform()
             success_count += 1
-            time.sleep(0.5)
         except WebDriverException:
             pass
         
-        # Strategy 2: Look for common close button selectors
-        close_selectors = [
-            "[data-dismiss='modal']",
-            ".modal-close",
-            ".close",
-            "[aria-label='Close']",
-            ".popup-close",
-            "[title='Close']"
-        ]
-        
-        for selector in close_selectors:
+        # Close buttons and overlays are found, and filtered to visible ones, in one round-trip
+        try:
+            close_buttons, overlays = driver.execute_script(
+                _FIND_POPUP_CONTROLS_SCRIPT, _CLOSE_BUTTON_SELECTOR, _OVERLAY_SELECTOR
+            )
+        except WebDriverException:
+            close_buttons, overlays = [], []
+        
+        # Strategy 2: Click common close buttons
+        clicked = 0
+        for element in close_buttons:
             try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        element.click()
-                        success_count += 1
-                        time.sleep(0.5)
+                element.click()
+                clicked += 1
+                _wait_until_hidden(driver, element)
             except WebDriverException:
                 continue
         
-        # Strategy 3: Look for overlay elements to click
-        try:
-            overlays = driver.find_elements(By.CSS_SELECTOR, ".modal-backdrop, .overlay, .popup-overlay")
-            for overlay in overlays:
-                if overlay.is_displayed():
-                    overlay.click()
-                    success_count += 1
-                    time.sleep(0.5)
-        except WebDriverException:
-            pass
+        success_count += clicked
+        
+        # Strategy 3: Click overlays; ones removed by an earlier click are skipped
+        for overlay in overlays:
+            try:
+                overlay.click()
+                success_count += 1
+                _wait_until_hidden(driver, overlay)
+            except WebDriverException:
+                continue
         
         if success_count > 0:
             return f"Successfully attempted to close popups using {success_count} methods"
@@ -362,13 +944,67 @@ def enhanced_close_popups() -> str:
 
 def cleanup_resources():
     """Clean up global resources."""
-    global _scraper, _browser_manager
-    if _scraper:
-        _scraper.close()
-    if _browser_manager:
-        _browser_manager.close_browser()
+    with _scrapers_lock:
+        scrapers = list(_scrapers.values())
+        _scrapers.clear()
+    for scraper in scrapers:
+        scraper._finalizer()
+    _seen_content.clear()
+    if _get_sync_session.cache_info().currsize:
+        _get_sync_session().close()
+        _get_sync_session.cache_clear()
+    if _extract_text_and_links.cache_info().currsize:
+        _extract_text_and_links.cache_clear()
+    if _get_browser_manager.cache_info().currsize:
+        _get_browser_manager().close_browser()
+        _get_browser_manager.cache_clear()
 
 # Synchronous scraping implementation
+_sync_config = ScrapingConfig()
+
+
+@functools.cache
+def _get_sync_session() -> requests.Session:
+    """Get or create the requests session shared by scrape_website calls."""
+    _install_dns_cache()
+    session = requests.Session()
+    # Up to 64 idle sockets per host so repeated scrapes of one site skip the TCP+TLS handshake
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, pool_block=False,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    
+    # Stable headers for the session's lifetime keep the client fingerprint consistent
+    session.headers.update({
+        'User-Agent': random.choice(_sync_config.user_agents),
+        'Connection': 'keep-alive',
+        'Accept-Encoding': 'br, gzip, deflate',
+    })
+    return session
+
+# Next allowed request time per host, shared by tool calls running in worker threads
+_sync_host_next: dict[str, float] = {}
+_sync_host_lock = threading.Lock()
+
+
+def _wait_for_host(url: str) -> None:
+    """
+    Block until the politeness delay for this URL's host has elapsed.
+    Each caller reserves its slot under the lock and sleeps outside it, so requests
+    to different hosts never wait on each other.
+    """
+    host = urlsplit(url).netloc
+    delay = random.uniform(_sync_config.min_delay, _sync_config.max_delay)
+    
+    with _sync_host_lock:
+        now = time.time()
+        start = max(now, _sync_host_next.get(host, 0.0))
+        _sync_host_next[host] = start + delay
+    
+    if start > now:
+        time.sleep(start - now)
+
+
 @tool
 def scrape_website(url: str) -> str:
     """
@@ -382,89 +1018,42 @@ def scrape_website(url: str) -> str:
         Returns an error message string if scraping fails.
     """
     try:
-        import time
-        import random
-        import requests
+        # Per-host rate limiting: only wait if this host was hit recently
+        _wait_for_host(url)
         
-        # Try BeautifulSoup first, fall back to basic parsing if not available
-        try:
-            from bs4 import BeautifulSoup
-            use_bs4 = True
-        except ImportError:
-            use_bs4 = False
-        
-        # Simple rate limiting
-        time.sleep(random.uniform(2.0, 8.0))
-        
-        # Create session with user agent
-        session = requests.Session()
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        ]
-        
-        session.headers.update({
-            'User-Agent': random.choice(user_agents)
-        })
-        
-        # Make the request
-        response = session.get(url, timeout=30)
-        response.raise_for_status()
-        
-        if use_bs4:
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract text content more efficiently
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            text_content = soup.get_text(strip=True, separator=' ')
-            
-            # Extract all links with better filtering
-            links = []
-            for link in soup.find_all('a', href=True):
-                # Ensure we have a Tag element that supports the get method
-                if hasattr(link, 'get'):
-                    href = link.get('href')
-                    if href and not href.startswith(('#', 'javascript:', 'mailto:')):
-                        links.append(href)
-        else:
-            # Fallback: basic text extraction using regex
-            import re
+        # Make the request over the shared keep-alive pool
+        with _get_sync_session().get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            skip_reason = _unscrapable_reason(response.headers, _sync_config.max_content_length)
+            if skip_reason:
+                return f"Skipped {url}: {skip_reason}"
             
-            # Remove script and style tags
-            text_content = re.sub(r'<script[^>]*>.*?</script>', '', response.text, flags=re.DOTALL | re.IGNORECASE)
-            text_content = re.sub(r'<style[^>]*>.*?</style>', '', text_content, flags=re.DOTALL | re.IGNORECASE)
+            # Cap the decompressed size, not the wire size, so a compression bomb stays bounded
+            limit = _sync_config.max_body_bytes
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                received += len(chunk)
+                if received >= limit:
+                    break
             
-            # Remove HTML tags
-            text_content = re.sub(r'<[^>]+>', ' ', text_content)
-            
-            # Clean up whitespace
-            text_content = re.sub(r'\s+', ' ', text_content).strip()
-            
-            # Extract links using regex
-            link_pattern = r'<a[^>]+href=["\']([^"\']+)["\'][^>]*>'
-            links = re.findall(link_pattern, response.text, re.IGNORECASE)
-            
-            # Filter links
-            links = [href for href in links if href and not href.startswith(('#', 'javascript:', 'mailto:'))]
+            html = _decode_body(
+                b''.join(chunks)[:limit], response.headers.get('Content-Type', ''), truncated=received >= limit
+            )
+        
+        # Parse with the lexbor C parser, which itself falls back to lxml
+        text_content, links = _extract_text_and_links(html)
+        links = list(links)
         
         # Limit output size to prevent token overflow
-        if len(text_content) > 10000:
-            text_content = text_content[:10000] + "... [TRUNCATED]"
+        if len(text_content) > _MAX_TEXT_CHARS:
+            text_content = text_content[:_MAX_TEXT_CHARS] + "... [TRUNCATED]"
         
-        if len(links) > 50:
-            links = links[:50] + ["... [MORE LINKS TRUNCATED]"]
+        if len(links) > _MAX_LINKS:
+            links = links[:_MAX_LINKS] + ["... [MORE LINKS TRUNCATED]"]
         
-        result = f"Text Content:\n{text_content}\n\nLinks:\n" + '\n'.join(links)
-        session.close()
-        return result
+        return f"Text Content:\n{text_content}\n\nLinks:\n" + '\n'.join(links)
         
     except Exception as e:
         return f"Error scraping {url}: {str(e)}"
-
-
-atexit.register(cleanup_resources)